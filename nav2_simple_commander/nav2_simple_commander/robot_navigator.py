@@ -14,12 +14,15 @@
 # limitations under the License.
 
 
-from enum import Enum
+from dataclasses import dataclass, field
+from enum import IntEnum
+from functools import cached_property, lru_cache
+import threading
 import time
+from typing import Any
 
 from action_msgs.msg import GoalStatus
 from builtin_interfaces.msg import Duration
-from geometry_msgs.msg import Point
 from geometry_msgs.msg import PoseStamped
 from geometry_msgs.msg import PoseWithCovarianceStamped
 from lifecycle_msgs.srv import GetState
@@ -35,354 +38,452 @@ from nav2_msgs.action import (
 from nav2_msgs.action import SmoothPath
 from nav2_msgs.srv import ClearEntireCostmap, GetCostmap, LoadMap, ManageLifecycleNodes
 
-import rclpy
 from rclpy.action import ActionClient
 from rclpy.duration import Duration as rclpyDuration
+from rclpy.executors import ExternalShutdownException, SingleThreadedExecutor
 from rclpy.node import Node
 from rclpy.qos import QoSDurabilityPolicy, QoSHistoryPolicy
 from rclpy.qos import QoSProfile, QoSReliabilityPolicy
+from rclpy.task import Future
 
+try:
+    from rclpy.experimental import EventsExecutor
+except ImportError:
+    EventsExecutor = None
 
-class TaskResult(Enum):
+
+class Nav2TimeoutError(TimeoutError):
+    """A wait on Nav2 did not complete in time."""
+
+
+class TaskResult(IntEnum):
     UNKNOWN = 0
     SUCCEEDED = 1
     CANCELED = 2
     FAILED = 3
 
 
+_STATUS_MAP = {
+    GoalStatus.STATUS_SUCCEEDED: TaskResult.SUCCEEDED,
+    GoalStatus.STATUS_ABORTED: TaskResult.FAILED,
+    GoalStatus.STATUS_CANCELED: TaskResult.CANCELED,
+}
+
+_AMCL_POSE_QOS = QoSProfile(
+    durability=QoSDurabilityPolicy.TRANSIENT_LOCAL,
+    reliability=QoSReliabilityPolicy.RELIABLE,
+    history=QoSHistoryPolicy.KEEP_LAST,
+    depth=1,
+)
+
+
+@lru_cache(maxsize=16)
+def _int_duration(sec):
+    # Shared between goals, must not be modified once handed out
+    return Duration(sec=sec)
+
+
+def _duration(sec):
+    # 10.0 would hit the cache entry of 10, other types get no cache and
+    # fail the message's own type check as before
+    if type(sec) is int:
+        return _int_duration(sec)
+    return Duration(sec=sec)
+
+
+@dataclass(slots=True)
+class _NavState:
+    # Bookkeeping of the current task
+    goal_handle: Any = None
+    result_future: Any = None
+    result_done: threading.Event = field(default_factory=threading.Event)
+    feedback: Any = None
+    status: Any = None
+
+
+def _state_property(name):
+    return property(
+        lambda self: getattr(self._state, name),
+        lambda self, value: setattr(self._state, name, value),
+    )
+
+
 class BasicNavigator(Node):
 
-    def __init__(self, node_name='basic_navigator', namespace=''):
+    # Node keeps a __dict__, which the cached client properties rely on, so
+    # only the attributes assigned in __init__ are given slots
+    __slots__ = (
+        'server_timeout',
+        'request_timeout',
+        'result_timeout',
+        'poll_timeout',
+        'initial_pose',
+        'initial_pose_received',
+        'initial_pose_pub',
+        'localization_pose_sub',
+        '_state',
+        '_feedback_cb',
+        '_initial_pose_msg',
+        '_initial_pose_event',
+        '_lifecycle_clients',
+        '_state_clients',
+        '_nav_through_poses_goal',
+        '_nav_to_pose_goal',
+        '_follow_waypoints_goal',
+        '_follow_gps_waypoints_goal',
+        '_spin_goal',
+        '_backup_goal',
+        '_drive_on_heading_goal',
+        '_assisted_teleop_goal',
+        '_follow_path_goal',
+        '_compute_path_to_pose_goal',
+        '_compute_path_through_poses_goal',
+        '_smooth_path_goal',
+        '_executor',
+        '_executor_thread',
+    )
+
+    # Clients are only created once they are first used
+    _LAZY_CLIENTS = (
+        'nav_through_poses_client',
+        'nav_to_pose_client',
+        'follow_waypoints_client',
+        'follow_gps_waypoints_client',
+        'follow_path_client',
+        'compute_path_to_pose_client',
+        'compute_path_through_poses_client',
+        'smoother_client',
+        'spin_client',
+        'backup_client',
+        'drive_on_heading_client',
+        'assisted_teleop_client',
+        'change_maps_srv',
+        'clear_costmap_global_srv',
+        'clear_costmap_local_srv',
+        'get_costmap_global_srv',
+        'get_costmap_local_srv',
+    )
+
+    # Empty requests carry no fields, one instance serves every call
+    _EMPTY_CLEAR_REQ = ClearEntireCostmap.Request()
+    _EMPTY_GETCOSTMAP_REQ = GetCostmap.Request()
+
+    goal_handle = _state_property('goal_handle')
+    result_future = _state_property('result_future')
+    feedback = _state_property('feedback')
+    status = _state_property('status')
+
+    def __init__(
+        self,
+        node_name='basic_navigator',
+        namespace='',
+        poll_timeout=0.10,
+        server_timeout=None,
+        request_timeout=None,
+        result_timeout=None,
+        use_events_executor=False,
+    ):
+        # Checked before the node exists so a failure leaves nothing behind
+        if use_events_executor and EventsExecutor is None:
+            raise RuntimeError('EventsExecutor is not available in this rclpy')
         super().__init__(node_name=node_name, namespace=namespace)
+        # Longest wait for a server to come up before raising, None waits forever
+        self.server_timeout = server_timeout
+        # Longest wait for a goal or service response, None waits forever
+        self.request_timeout = request_timeout
+        # Longest wait for the result of a planning or smoothing request
+        self.result_timeout = result_timeout
+        # Longest isTaskComplete() blocks waiting for a pending task
+        self.poll_timeout = poll_timeout
         self.initial_pose = PoseStamped()
         self.initial_pose.header.frame_id = 'map'
-        self.goal_handle = None
-        self.result_future = None
-        self.feedback = None
-        self.status = None
-
-        amcl_pose_qos = QoSProfile(
-            durability=QoSDurabilityPolicy.TRANSIENT_LOCAL,
-            reliability=QoSReliabilityPolicy.RELIABLE,
-            history=QoSHistoryPolicy.KEEP_LAST,
-            depth=1,
-        )
+        # Reused for every initial pose publish, refreshed from initial_pose each time
+        self._initial_pose_msg = PoseWithCovarianceStamped()
+        self._state = _NavState()
+        # Bound once, every task request hands the same callback to rclpy
+        self._feedback_cb = self._feedbackCallback
+        # Lifecycle manager clients, created once per discovered service
+        self._lifecycle_clients = {}
+        # Lifecycle state clients, created once per polled node
+        self._state_clients = {}
 
         self.initial_pose_received = False
-        self.nav_through_poses_client = ActionClient(
-            self, NavigateThroughPoses, 'navigate_through_poses'
-        )
-        self.nav_to_pose_client = ActionClient(self, NavigateToPose, 'navigate_to_pose')
-        self.follow_waypoints_client = ActionClient(
-            self, FollowWaypoints, 'follow_waypoints'
-        )
-        self.follow_gps_waypoints_client = ActionClient(
-            self, FollowGPSWaypoints, 'follow_gps_waypoints'
-        )
-        self.follow_path_client = ActionClient(self, FollowPath, 'follow_path')
-        self.compute_path_to_pose_client = ActionClient(
-            self, ComputePathToPose, 'compute_path_to_pose'
-        )
-        self.compute_path_through_poses_client = ActionClient(
-            self, ComputePathThroughPoses, 'compute_path_through_poses'
-        )
-        self.smoother_client = ActionClient(self, SmoothPath, 'smooth_path')
-        self.spin_client = ActionClient(self, Spin, 'spin')
-        self.backup_client = ActionClient(self, BackUp, 'backup')
-        self.drive_on_heading_client = ActionClient(
-            self, DriveOnHeading, 'drive_on_heading'
-        )
-        self.assisted_teleop_client = ActionClient(
-            self, AssistedTeleop, 'assisted_teleop'
-        )
+        self._initial_pose_event = threading.Event()
+        # Task goals are reused between requests, send_goal_async() serializes
+        # them right away so refilling the fields on the next call is safe
+        self._nav_through_poses_goal = NavigateThroughPoses.Goal()
+        self._nav_to_pose_goal = NavigateToPose.Goal()
+        self._follow_waypoints_goal = FollowWaypoints.Goal()
+        self._follow_gps_waypoints_goal = FollowGPSWaypoints.Goal()
+        self._spin_goal = Spin.Goal()
+        self._backup_goal = BackUp.Goal()
+        self._drive_on_heading_goal = DriveOnHeading.Goal()
+        self._assisted_teleop_goal = AssistedTeleop.Goal()
+        self._follow_path_goal = FollowPath.Goal()
+        self._compute_path_to_pose_goal = ComputePathToPose.Goal()
+        self._compute_path_through_poses_goal = ComputePathThroughPoses.Goal()
+        self._smooth_path_goal = SmoothPath.Goal()
+
         self.localization_pose_sub = self.create_subscription(
             PoseWithCovarianceStamped,
             'amcl_pose',
             self._amclPoseCallback,
-            amcl_pose_qos,
+            _AMCL_POSE_QOS,
         )
         self.initial_pose_pub = self.create_publisher(
             PoseWithCovarianceStamped, 'initialpose', 10
         )
-        self.change_maps_srv = self.create_client(LoadMap, 'map_server/load_map')
-        self.clear_costmap_global_srv = self.create_client(
+
+        # Spin in the background so futures complete as their responses
+        # arrive rather than by draining the node's callbacks on each wait
+        if use_events_executor:
+            self._executor = EventsExecutor()
+        else:
+            self._executor = SingleThreadedExecutor()
+        self._executor.add_node(self)
+        self._executor_thread = threading.Thread(target=self._spinExecutor, daemon=True)
+        self._executor_thread.start()
+
+    @cached_property
+    def nav_through_poses_client(self):
+        return ActionClient(self, NavigateThroughPoses, 'navigate_through_poses')
+
+    @cached_property
+    def nav_to_pose_client(self):
+        return ActionClient(self, NavigateToPose, 'navigate_to_pose')
+
+    @cached_property
+    def follow_waypoints_client(self):
+        return ActionClient(self, FollowWaypoints, 'follow_waypoints')
+
+    @cached_property
+    def follow_gps_waypoints_client(self):
+        return ActionClient(self, FollowGPSWaypoints, 'follow_gps_waypoints')
+
+    @cached_property
+    def follow_path_client(self):
+        return ActionClient(self, FollowPath, 'follow_path')
+
+    @cached_property
+    def compute_path_to_pose_client(self):
+        return ActionClient(self, ComputePathToPose, 'compute_path_to_pose')
+
+    @cached_property
+    def compute_path_through_poses_client(self):
+        return ActionClient(self, ComputePathThroughPoses, 'compute_path_through_poses')
+
+    @cached_property
+    def smoother_client(self):
+        return ActionClient(self, SmoothPath, 'smooth_path')
+
+    @cached_property
+    def spin_client(self):
+        return ActionClient(self, Spin, 'spin')
+
+    @cached_property
+    def backup_client(self):
+        return ActionClient(self, BackUp, 'backup')
+
+    @cached_property
+    def drive_on_heading_client(self):
+        return ActionClient(self, DriveOnHeading, 'drive_on_heading')
+
+    @cached_property
+    def assisted_teleop_client(self):
+        return ActionClient(self, AssistedTeleop, 'assisted_teleop')
+
+    @cached_property
+    def change_maps_srv(self):
+        return self.create_client(LoadMap, 'map_server/load_map')
+
+    @cached_property
+    def clear_costmap_global_srv(self):
+        return self.create_client(
             ClearEntireCostmap, 'global_costmap/clear_entirely_global_costmap'
         )
-        self.clear_costmap_local_srv = self.create_client(
-            ClearEntireCostmap, 'local_costmap/clear_entirely_local_costmap'
-        )
-        self.get_costmap_global_srv = self.create_client(
-            GetCostmap, 'global_costmap/get_costmap'
-        )
-        self.get_costmap_local_srv = self.create_client(
-            GetCostmap, 'local_costmap/get_costmap'
-        )
 
-    def destroyNode(self):
-        self.destroy_node()
+    @cached_property
+    def clear_costmap_local_srv(self):
+        return self.create_client(ClearEntireCostmap, 'local_costmap/clear_entirely_local_costmap')
+
+    @cached_property
+    def get_costmap_global_srv(self):
+        return self.create_client(GetCostmap, 'global_costmap/get_costmap')
+
+    @cached_property
+    def get_costmap_local_srv(self):
+        return self.create_client(GetCostmap, 'local_costmap/get_costmap')
 
     def destroy_node(self):
-        self.nav_through_poses_client.destroy()
-        self.nav_to_pose_client.destroy()
-        self.follow_waypoints_client.destroy()
-        self.follow_path_client.destroy()
-        self.compute_path_to_pose_client.destroy()
-        self.compute_path_through_poses_client.destroy()
-        self.smoother_client.destroy()
-        self.spin_client.destroy()
-        self.backup_client.destroy()
-        self.drive_on_heading_client.destroy()
+        self._executor.shutdown()
+        self._executor_thread.join()
+        for attr in self._LAZY_CLIENTS:
+            client = self.__dict__.get(attr)
+            if isinstance(client, ActionClient):
+                client.destroy()
+            elif client is not None:
+                self.destroy_client(client)
+        for clients in (self._lifecycle_clients, self._state_clients):
+            for client in clients.values():
+                self.destroy_client(client)
+            clients.clear()
         super().destroy_node()
 
+    def destroyNode(self):
+        self.destroy_node()
+
     def setInitialPose(self, initial_pose):
         """Set the initial pose to the localization system."""
         self.initial_pose_received = False
+        self._initial_pose_event.clear()
         self.initial_pose = initial_pose
         self._setInitialPose()
 
     def goThroughPoses(self, poses, behavior_tree=''):
         """Send a `NavThroughPoses` action request."""
-        self.debug("Waiting for 'NavigateThroughPoses' action server")
-        while not self.nav_through_poses_client.wait_for_server(timeout_sec=1.0):
-            self.info("'NavigateThroughPoses' action server not available, waiting...")
-
-        goal_msg = NavigateThroughPoses.Goal()
+        goal_msg = self._nav_through_poses_goal
         goal_msg.poses = poses
         goal_msg.behavior_tree = behavior_tree
 
-        self.info(f'Navigating with {len(goal_msg.poses)} goals....')
-        send_goal_future = self.nav_through_poses_client.send_goal_async(
-            goal_msg, self._feedbackCallback
+        num_poses = len(poses)
+        self.info(f'Navigating with {num_poses} goals....')
+        return self._sendGoal(
+            self.nav_through_poses_client,
+            'NavigateThroughPoses',
+            goal_msg,
+            'Goal with {} poses was rejected!',
+            num_poses,
         )
-        rclpy.spin_until_future_complete(self, send_goal_future)
-        self.goal_handle = send_goal_future.result()
-
-        if not self.goal_handle.accepted:
-            self.error(f'Goal with {len(poses)} poses was rejected!')
-            return False
-
-        self.result_future = self.goal_handle.get_result_async()
-        return True
 
     def goToPose(self, pose, behavior_tree=''):
         """Send a `NavToPose` action request."""
-        self.debug("Waiting for 'NavigateToPose' action server")
-        while not self.nav_to_pose_client.wait_for_server(timeout_sec=1.0):
-            self.info("'NavigateToPose' action server not available, waiting...")
-
-        goal_msg = NavigateToPose.Goal()
+        goal_msg = self._nav_to_pose_goal
         goal_msg.pose = pose
         goal_msg.behavior_tree = behavior_tree
 
         self.info(
-            'Navigating to goal: '
-            + str(pose.pose.position.x)
-            + ' '
-            + str(pose.pose.position.y)
-            + '...'
+            f'Navigating to goal: {pose.pose.position.x} {pose.pose.position.y}...'
         )
-        send_goal_future = self.nav_to_pose_client.send_goal_async(
-            goal_msg, self._feedbackCallback
+        return self._sendGoal(
+            self.nav_to_pose_client,
+            'NavigateToPose',
+            goal_msg,
+            'Goal to {} {} was rejected!',
+            pose.pose.position.x,
+            pose.pose.position.y,
         )
-        rclpy.spin_until_future_complete(self, send_goal_future)
-        self.goal_handle = send_goal_future.result()
-
-        if not self.goal_handle.accepted:
-            self.error(
-                'Goal to '
-                + str(pose.pose.position.x)
-                + ' '
-                + str(pose.pose.position.y)
-                + ' was rejected!'
-            )
-            return False
-
-        self.result_future = self.goal_handle.get_result_async()
-        return True
 
     def followWaypoints(self, poses):
         """Send a `FollowWaypoints` action request."""
-        self.debug("Waiting for 'FollowWaypoints' action server")
-        while not self.follow_waypoints_client.wait_for_server(timeout_sec=1.0):
-            self.info("'FollowWaypoints' action server not available, waiting...")
-
-        goal_msg = FollowWaypoints.Goal()
+        goal_msg = self._follow_waypoints_goal
         goal_msg.poses = poses
 
-        self.info(f'Following {len(goal_msg.poses)} goals....')
-        send_goal_future = self.follow_waypoints_client.send_goal_async(
-            goal_msg, self._feedbackCallback
+        num_poses = len(poses)
+        self.info(f'Following {num_poses} goals....')
+        return self._sendGoal(
+            self.follow_waypoints_client,
+            'FollowWaypoints',
+            goal_msg,
+            'Following {} waypoints request was rejected!',
+            num_poses,
         )
-        rclpy.spin_until_future_complete(self, send_goal_future)
-        self.goal_handle = send_goal_future.result()
-
-        if not self.goal_handle.accepted:
-            self.error(f'Following {len(poses)} waypoints request was rejected!')
-            return False
-
-        self.result_future = self.goal_handle.get_result_async()
-        return True
 
     def followGpsWaypoints(self, gps_poses):
         """Send a `FollowGPSWaypoints` action request."""
-        self.debug("Waiting for 'FollowWaypoints' action server")
-        while not self.follow_gps_waypoints_client.wait_for_server(timeout_sec=1.0):
-            self.info("'FollowWaypoints' action server not available, waiting...")
-
-        goal_msg = FollowGPSWaypoints.Goal()
+        goal_msg = self._follow_gps_waypoints_goal
         goal_msg.gps_poses = gps_poses
 
-        self.info(f'Following {len(goal_msg.gps_poses)} gps goals....')
-        send_goal_future = self.follow_gps_waypoints_client.send_goal_async(
-            goal_msg, self._feedbackCallback
+        num_poses = len(gps_poses)
+        self.info(f'Following {num_poses} gps goals....')
+        return self._sendGoal(
+            self.follow_gps_waypoints_client,
+            'FollowGPSWaypoints',
+            goal_msg,
+            'Following {} gps waypoints request was rejected!',
+            num_poses,
         )
-        rclpy.spin_until_future_complete(self, send_goal_future)
-        self.goal_handle = send_goal_future.result()
-
-        if not self.goal_handle.accepted:
-            self.error(
-                f'Following {len(gps_poses)} gps waypoints request was rejected!'
-            )
-            return False
-
-        self.result_future = self.goal_handle.get_result_async()
-        return True
 
     def spin(self, spin_dist=1.57, time_allowance=10):
-        self.debug("Waiting for 'Spin' action server")
-        while not self.spin_client.wait_for_server(timeout_sec=1.0):
-            self.info("'Spin' action server not available, waiting...")
-        goal_msg = Spin.Goal()
+        goal_msg = self._spin_goal
         goal_msg.target_yaw = spin_dist
-        goal_msg.time_allowance = Duration(sec=time_allowance)
+        goal_msg.time_allowance = _duration(time_allowance)
 
         self.info(f'Spinning to angle {goal_msg.target_yaw}....')
-        send_goal_future = self.spin_client.send_goal_async(
-            goal_msg, self._feedbackCallback
-        )
-        rclpy.spin_until_future_complete(self, send_goal_future)
-        self.goal_handle = send_goal_future.result()
-
-        if not self.goal_handle.accepted:
-            self.error('Spin request was rejected!')
-            return False
-
-        self.result_future = self.goal_handle.get_result_async()
-        return True
+        return self._sendGoal(self.spin_client, 'Spin', goal_msg, 'Spin request was rejected!')
 
     def backup(self, backup_dist=0.15, backup_speed=0.025, time_allowance=10):
-        self.debug("Waiting for 'Backup' action server")
-        while not self.backup_client.wait_for_server(timeout_sec=1.0):
-            self.info("'Backup' action server not available, waiting...")
-        goal_msg = BackUp.Goal()
-        goal_msg.target = Point(x=float(backup_dist))
+        goal_msg = self._backup_goal
+        goal_msg.target.x = float(backup_dist)
         goal_msg.speed = backup_speed
-        goal_msg.time_allowance = Duration(sec=time_allowance)
+        goal_msg.time_allowance = _duration(time_allowance)
 
         self.info(f'Backing up {goal_msg.target.x} m at {goal_msg.speed} m/s....')
-        send_goal_future = self.backup_client.send_goal_async(
-            goal_msg, self._feedbackCallback
+        return self._sendGoal(
+            self.backup_client, 'Backup', goal_msg, 'Backup request was rejected!'
         )
-        rclpy.spin_until_future_complete(self, send_goal_future)
-        self.goal_handle = send_goal_future.result()
-
-        if not self.goal_handle.accepted:
-            self.error('Backup request was rejected!')
-            return False
-
-        self.result_future = self.goal_handle.get_result_async()
-        return True
 
     def driveOnHeading(self, dist=0.15, speed=0.025, time_allowance=10):
-        self.debug("Waiting for 'DriveOnHeading' action server")
-        while not self.backup_client.wait_for_server(timeout_sec=1.0):
-            self.info("'DriveOnHeading' action server not available, waiting...")
-        goal_msg = DriveOnHeading.Goal()
-        goal_msg.target = Point(x=float(dist))
+        goal_msg = self._drive_on_heading_goal
+        goal_msg.target.x = float(dist)
         goal_msg.speed = speed
-        goal_msg.time_allowance = Duration(sec=time_allowance)
+        goal_msg.time_allowance = _duration(time_allowance)
 
         self.info(f'Drive {goal_msg.target.x} m on heading at {goal_msg.speed} m/s....')
-        send_goal_future = self.drive_on_heading_client.send_goal_async(
-            goal_msg, self._feedbackCallback
+        return self._sendGoal(
+            self.drive_on_heading_client,
+            'DriveOnHeading',
+            goal_msg,
+            'Drive On Heading request was rejected!',
         )
-        rclpy.spin_until_future_complete(self, send_goal_future)
-        self.goal_handle = send_goal_future.result()
-
-        if not self.goal_handle.accepted:
-            self.error('Drive On Heading request was rejected!')
-            return False
-
-        self.result_future = self.goal_handle.get_result_async()
-        return True
 
     def assistedTeleop(self, time_allowance=30):
-        self.debug("Wainting for 'assisted_teleop' action server")
-        while not self.assisted_teleop_client.wait_for_server(timeout_sec=1.0):
-            self.info("'assisted_teleop' action server not available, waiting...")
-        goal_msg = AssistedTeleop.Goal()
-        goal_msg.time_allowance = Duration(sec=time_allowance)
+        goal_msg = self._assisted_teleop_goal
+        goal_msg.time_allowance = _duration(time_allowance)
 
         self.info("Running 'assisted_teleop'....")
-        send_goal_future = self.assisted_teleop_client.send_goal_async(
-            goal_msg, self._feedbackCallback
+        return self._sendGoal(
+            self.assisted_teleop_client,
+            'AssistedTeleop',
+            goal_msg,
+            'Assisted Teleop request was rejected!',
         )
-        rclpy.spin_until_future_complete(self, send_goal_future)
-        self.goal_handle = send_goal_future.result()
-
-        if not self.goal_handle.accepted:
-            self.error('Assisted Teleop request was rejected!')
-            return False
-
-        self.result_future = self.goal_handle.get_result_async()
-        return True
 
     def followPath(self, path, controller_id='', goal_checker_id=''):
         """Send a `FollowPath` action request."""
-        self.debug("Waiting for 'FollowPath' action server")
-        while not self.follow_path_client.wait_for_server(timeout_sec=1.0):
-            self.info("'FollowPath' action server not available, waiting...")
-
-        goal_msg = FollowPath.Goal()
+        goal_msg = self._follow_path_goal
         goal_msg.path = path
         goal_msg.controller_id = controller_id
         goal_msg.goal_checker_id = goal_checker_id
 
         self.info('Executing path...')
-        send_goal_future = self.follow_path_client.send_goal_async(
-            goal_msg, self._feedbackCallback
+        return self._sendGoal(
+            self.follow_path_client, 'FollowPath', goal_msg, 'Follow path was rejected!'
         )
-        rclpy.spin_until_future_complete(self, send_goal_future)
-        self.goal_handle = send_goal_future.result()
-
-        if not self.goal_handle.accepted:
-            self.error('Follow path was rejected!')
-            return False
-
-        self.result_future = self.goal_handle.get_result_async()
-        return True
 
     def cancelTask(self):
         """Cancel pending task request of any type."""
         self.info('Canceling current task.')
-        if self.result_future:
-            future = self.goal_handle.cancel_goal_async()
-            rclpy.spin_until_future_complete(self, future)
+        if self._state.result_future:
+            future = self._state.goal_handle.cancel_goal_async()
+            self._waitForFuture(future)
         return
 
     def isTaskComplete(self):
         """Check if the task request of any type is complete yet."""
-        if not self.result_future:
+        if not self._state.result_future:
             # task was cancelled or completed
             return True
-        rclpy.spin_until_future_complete(self, self.result_future, timeout_sec=0.10)
-        if self.result_future.result():
-            self.status = self.result_future.result().status
-            if self.status != GoalStatus.STATUS_SUCCEEDED:
-                self.debug(f'Task with failed with status code: {self.status}')
+        if not self._state.result_done.wait(timeout=self.poll_timeout):
+            # Timed out, still processing, not complete yet
+            return False
+        res = self._state.result_future.result()
+        if res:
+            self._state.status = res.status
+            if self._state.status != GoalStatus.STATUS_SUCCEEDED:
+                self.debug(f'Task with failed with status code: {self._state.status}')
                 return True
         else:
-            # Timed out, still processing, not complete yet
+            # Done without a result, nothing to report yet
             return False
 
         self.debug('Task succeeded!')
@@ -390,66 +491,50 @@ class BasicNavigator(Node):
 
     def getFeedback(self):
         """Get the pending action feedback message."""
-        return self.feedback
+        return self._state.feedback
 
     def getResult(self):
         """Get the pending action result message."""
-        if self.status == GoalStatus.STATUS_SUCCEEDED:
-            return TaskResult.SUCCEEDED
-        elif self.status == GoalStatus.STATUS_ABORTED:
-            return TaskResult.FAILED
-        elif self.status == GoalStatus.STATUS_CANCELED:
-            return TaskResult.CANCELED
-        else:
-            return TaskResult.UNKNOWN
+        return _STATUS_MAP.get(self._state.status, TaskResult.UNKNOWN)
 
-    def waitUntilNav2Active(self, navigator='bt_navigator', localizer='amcl'):
+    def waitUntilNav2Active(
+        self, navigator='bt_navigator', localizer='amcl', timeout_sec=None
+    ):
         """Block until the full navigation system is up and running."""
+        deadline = self._deadline(timeout_sec)
         if localizer != 'robot_localization':  # non-lifecycle node
-            self._waitForNodeToActivate(localizer)
+            self._waitForNodeToActivate(localizer, self._remaining(deadline))
         if localizer == 'amcl':
-            self._waitForInitialPose()
-        self._waitForNodeToActivate(navigator)
+            self._waitForInitialPose(self._remaining(deadline))
+        self._waitForNodeToActivate(navigator, self._remaining(deadline))
         self.info('Nav2 is ready for use!')
         return
 
-    def _getPathImpl(self, start, goal, planner_id='', use_start=False):
+    def _getPathImpl(self, start, goal, planner_id='', use_start=False, timeout_sec=None):
         """
         Send a `ComputePathToPose` action request.
 
         Internal implementation to get the full result, not just the path.
         """
-        self.debug("Waiting for 'ComputePathToPose' action server")
-        while not self.compute_path_to_pose_client.wait_for_server(timeout_sec=1.0):
-            self.info("'ComputePathToPose' action server not available, waiting...")
-
-        goal_msg = ComputePathToPose.Goal()
-        goal_msg.start = start
-        goal_msg.goal = goal
-        goal_msg.planner_id = planner_id
-        goal_msg.use_start = use_start
+        goal_msg = self._fillPathGoal(
+            self._compute_path_to_pose_goal, start, goal, planner_id, use_start
+        )
 
         self.info('Getting path...')
-        send_goal_future = self.compute_path_to_pose_client.send_goal_async(goal_msg)
-        rclpy.spin_until_future_complete(self, send_goal_future)
-        self.goal_handle = send_goal_future.result()
-
-        if not self.goal_handle.accepted:
-            self.error('Get path was rejected!')
-            return None
-
-        self.result_future = self.goal_handle.get_result_async()
-        rclpy.spin_until_future_complete(self, self.result_future)
-        self.status = self.result_future.result().status
-
-        return self.result_future.result().result
+        return self._runAction(
+            self.compute_path_to_pose_client,
+            'ComputePathToPose',
+            goal_msg,
+            'Get path was rejected!',
+            timeout_sec,
+        )
 
-    def getPath(self, start, goal, planner_id='', use_start=False):
+    def getPath(self, start, goal, planner_id='', use_start=False, timeout_sec=None):
         """Send a `ComputePathToPose` action request."""
-        rtn = self._getPathImpl(start, goal, planner_id, use_start)
+        rtn = self._getPathImpl(start, goal, planner_id, use_start, timeout_sec)
 
-        if self.status != GoalStatus.STATUS_SUCCEEDED:
-            self.warn(f'Getting path failed with status code: {self.status}')
+        if self._state.status != GoalStatus.STATUS_SUCCEEDED:
+            self.warn(f'Getting path failed with status code: {self._state.status}')
             return None
 
         if not rtn:
@@ -457,49 +542,39 @@ class BasicNavigator(Node):
         else:
             return rtn.path
 
-    def _getPathThroughPosesImpl(self, start, goals, planner_id='', use_start=False):
+    def _getPathThroughPosesImpl(
+        self, start, goals, planner_id='', use_start=False, timeout_sec=None
+    ):
         """
         Send a `ComputePathThroughPoses` action request.
 
         Internal implementation to get the full result, not just the path.
         """
-        self.debug("Waiting for 'ComputePathThroughPoses' action server")
-        while not self.compute_path_through_poses_client.wait_for_server(
-            timeout_sec=1.0
-        ):
-            self.info(
-                "'ComputePathThroughPoses' action server not available, waiting..."
-            )
-
-        goal_msg = ComputePathThroughPoses.Goal()
+        goal_msg = self._compute_path_through_poses_goal
         goal_msg.start = start
         goal_msg.goals = goals
         goal_msg.planner_id = planner_id
         goal_msg.use_start = use_start
 
         self.info('Getting path...')
-        send_goal_future = self.compute_path_through_poses_client.send_goal_async(
-            goal_msg
+        return self._runAction(
+            self.compute_path_through_poses_client,
+            'ComputePathThroughPoses',
+            goal_msg,
+            'Get path was rejected!',
+            timeout_sec,
         )
-        rclpy.spin_until_future_complete(self, send_goal_future)
-        self.goal_handle = send_goal_future.result()
-
-        if not self.goal_handle.accepted:
-            self.error('Get path was rejected!')
-            return None
-
-        self.result_future = self.goal_handle.get_result_async()
-        rclpy.spin_until_future_complete(self, self.result_future)
-        self.status = self.result_future.result().status
-
-        return self.result_future.result().result
 
-    def getPathThroughPoses(self, start, goals, planner_id='', use_start=False):
+    def getPathThroughPoses(
+        self, start, goals, planner_id='', use_start=False, timeout_sec=None
+    ):
         """Send a `ComputePathThroughPoses` action request."""
-        rtn = self._getPathThroughPosesImpl(start, goals, planner_id, use_start)
+        rtn = self._getPathThroughPosesImpl(
+            start, goals, planner_id, use_start, timeout_sec
+        )
 
-        if self.status != GoalStatus.STATUS_SUCCEEDED:
-            self.warn(f'Getting path failed with status code: {self.status}')
+        if self._state.status != GoalStatus.STATUS_SUCCEEDED:
+            self.warn(f'Getting path failed with status code: {self._state.status}')
             return None
 
         if not rtn:
@@ -508,46 +583,43 @@ class BasicNavigator(Node):
             return rtn.path
 
     def _smoothPathImpl(
-        self, path, smoother_id='', max_duration=2.0, check_for_collision=False
+        self,
+        path,
+        smoother_id='',
+        max_duration=2.0,
+        check_for_collision=False,
+        timeout_sec=None,
     ):
         """
         Send a `SmoothPath` action request.
 
         Internal implementation to get the full result, not just the path.
         """
-        self.debug("Waiting for 'SmoothPath' action server")
-        while not self.smoother_client.wait_for_server(timeout_sec=1.0):
-            self.info("'SmoothPath' action server not available, waiting...")
-
-        goal_msg = SmoothPath.Goal()
+        goal_msg = self._fillSmoothGoal(
+            self._smooth_path_goal, smoother_id, max_duration, check_for_collision
+        )
         goal_msg.path = path
-        goal_msg.max_smoothing_duration = rclpyDuration(seconds=max_duration).to_msg()
-        goal_msg.smoother_id = smoother_id
-        goal_msg.check_for_collisions = check_for_collision
 
         self.info('Smoothing path...')
-        send_goal_future = self.smoother_client.send_goal_async(goal_msg)
-        rclpy.spin_until_future_complete(self, send_goal_future)
-        self.goal_handle = send_goal_future.result()
-
-        if not self.goal_handle.accepted:
-            self.error('Smooth path was rejected!')
-            return None
-
-        self.result_future = self.goal_handle.get_result_async()
-        rclpy.spin_until_future_complete(self, self.result_future)
-        self.status = self.result_future.result().status
-
-        return self.result_future.result().result
+        return self._runAction(
+            self.smoother_client, 'SmoothPath', goal_msg, 'Smooth path was rejected!', timeout_sec
+        )
 
     def smoothPath(
-        self, path, smoother_id='', max_duration=2.0, check_for_collision=False
+        self,
+        path,
+        smoother_id='',
+        max_duration=2.0,
+        check_for_collision=False,
+        timeout_sec=None,
     ):
         """Send a `SmoothPath` action request."""
-        rtn = self._smoothPathImpl(path, smoother_id, max_duration, check_for_collision)
+        rtn = self._smoothPathImpl(
+            path, smoother_id, max_duration, check_for_collision, timeout_sec
+        )
 
-        if self.status != GoalStatus.STATUS_SUCCEEDED:
-            self.warn(f'Getting path failed with status code: {self.status}')
+        if self._state.status != GoalStatus.STATUS_SUCCEEDED:
+            self.warn(f'Getting path failed with status code: {self._state.status}')
             return None
 
         if not rtn:
@@ -555,143 +627,444 @@ class BasicNavigator(Node):
         else:
             return rtn.path
 
-    def changeMap(self, map_filepath):
+    def getSmoothedPath(
+        self,
+        start,
+        goal,
+        planner_id='',
+        use_start=False,
+        smoother_id='',
+        max_duration=2.0,
+        check_for_collision=False,
+        timeout_sec=None,
+    ):
+        """Send a `ComputePathToPose` action request and smooth the resulting path."""
+        self._waitForServer(self.compute_path_to_pose_client, 'ComputePathToPose', timeout_sec)
+        self._waitForServer(self.smoother_client, 'SmoothPath', timeout_sec)
+
+        # Not the shared goals, a concurrent smoothPath() could refill them.
+        # Both are filled here so bad arguments raise in the caller
+        compute_goal = self._fillPathGoal(
+            ComputePathToPose.Goal(), start, goal, planner_id, use_start
+        )
+        smooth_goal = self._fillSmoothGoal(
+            SmoothPath.Goal(), smoother_id, max_duration, check_for_collision
+        )
+
+        # The smoother goal is sent from the executor as soon as the path
+        # arrives, so the caller only waits once for both requests
+        smoothed = Future()
+
+        def smooth(compute_result):
+            try:
+                smooth_goal.path = compute_result.path
+                self._chainGoal(
+                    self.smoother_client,
+                    smooth_goal,
+                    'Smooth path was rejected!',
+                    smoothed,
+                    smoothed.set_result,
+                )
+            except Exception as e:
+                # Hands the error to the waiting caller instead of the executor
+                smoothed.set_exception(e)
+
+        self._state.goal_handle = None
+        self._state.status = GoalStatus.STATUS_UNKNOWN
+        self.info('Getting smoothed path...')
+        self._chainGoal(
+            self.compute_path_to_pose_client,
+            compute_goal,
+            'Get path was rejected!',
+            smoothed,
+            smooth,
+        )
+
+        if not self._waitForFuture(smoothed, self._timeout(timeout_sec, self.result_timeout)):
+            self.error('Getting smoothed path timed out!')
+            smoothed.cancel()
+            if self._state.goal_handle is not None:
+                self._state.goal_handle.cancel_goal_async()
+            self._state.status = GoalStatus.STATUS_UNKNOWN
+            return None
+
+        rtn = smoothed.result()
+        if rtn is None:
+            self.warn(
+                f'Getting smoothed path failed with status code: {self._state.status}'
+            )
+            return None
+        return rtn.path
+
+    def changeMap(self, map_filepath, timeout_sec=None):
         """Change the current static map in the map server."""
-        while not self.change_maps_srv.wait_for_service(timeout_sec=1.0):
-            self.info('change map service not available, waiting...')
+        self._waitForService(self.change_maps_srv, 'change map', timeout_sec)
         req = LoadMap.Request()
         req.map_url = map_filepath
-        future = self.change_maps_srv.call_async(req)
-        rclpy.spin_until_future_complete(self, future)
-        status = future.result().result
-        if status != LoadMap.Response().RESULT_SUCCESS:
+        response = self._callService(self.change_maps_srv, req, timeout_sec)
+        if response is None:
+            self.error('Change map request timed out!')
+        elif response.result != LoadMap.Response().RESULT_SUCCESS:
             self.error('Change map request failed!')
         else:
             self.info('Change map request was successful!')
         return
 
-    def clearAllCostmaps(self):
+    def clearAllCostmaps(self, timeout_sec=None):
         """Clear all costmaps."""
-        self.clearLocalCostmap()
-        self.clearGlobalCostmap()
+        self._waitForService(self.clear_costmap_local_srv, 'Clear local costmaps', timeout_sec)
+        self._waitForService(self.clear_costmap_global_srv, 'Clear global costmaps', timeout_sec)
+        req = self._EMPTY_CLEAR_REQ
+        # Both requests are in flight together, so this waits one round trip
+        local, global_ = self._callServices(
+            [(self.clear_costmap_local_srv, req), (self.clear_costmap_global_srv, req)],
+            timeout_sec,
+        )
+        if local is None:
+            self.error('Clear local costmap request timed out!')
+        if global_ is None:
+            self.error('Clear global costmap request timed out!')
         return
 
-    def clearLocalCostmap(self):
+    def clearLocalCostmap(self, timeout_sec=None):
         """Clear local costmap."""
-        while not self.clear_costmap_local_srv.wait_for_service(timeout_sec=1.0):
-            self.info('Clear local costmaps service not available, waiting...')
-        req = ClearEntireCostmap.Request()
-        future = self.clear_costmap_local_srv.call_async(req)
-        rclpy.spin_until_future_complete(self, future)
+        self._waitForService(self.clear_costmap_local_srv, 'Clear local costmaps', timeout_sec)
+        req = self._EMPTY_CLEAR_REQ
+        if self._callService(self.clear_costmap_local_srv, req, timeout_sec) is None:
+            self.error('Clear local costmap request timed out!')
         return
 
-    def clearGlobalCostmap(self):
+    def clearGlobalCostmap(self, timeout_sec=None):
         """Clear global costmap."""
-        while not self.clear_costmap_global_srv.wait_for_service(timeout_sec=1.0):
-            self.info('Clear global costmaps service not available, waiting...')
-        req = ClearEntireCostmap.Request()
-        future = self.clear_costmap_global_srv.call_async(req)
-        rclpy.spin_until_future_complete(self, future)
+        self._waitForService(self.clear_costmap_global_srv, 'Clear global costmaps', timeout_sec)
+        req = self._EMPTY_CLEAR_REQ
+        if self._callService(self.clear_costmap_global_srv, req, timeout_sec) is None:
+            self.error('Clear global costmap request timed out!')
         return
 
-    def getGlobalCostmap(self):
+    def getGlobalCostmap(self, timeout_sec=None):
         """Get the global costmap."""
-        while not self.get_costmap_global_srv.wait_for_service(timeout_sec=1.0):
-            self.info('Get global costmaps service not available, waiting...')
-        req = GetCostmap.Request()
-        future = self.get_costmap_global_srv.call_async(req)
-        rclpy.spin_until_future_complete(self, future)
-        return future.result().map
-
-    def getLocalCostmap(self):
+        self._waitForService(self.get_costmap_global_srv, 'Get global costmaps', timeout_sec)
+        req = self._EMPTY_GETCOSTMAP_REQ
+        response = self._callService(self.get_costmap_global_srv, req, timeout_sec)
+        if response is None:
+            self.error('Get global costmap request timed out!')
+            return None
+        return response.map
+
+    def getLocalCostmap(self, timeout_sec=None):
         """Get the local costmap."""
-        while not self.get_costmap_local_srv.wait_for_service(timeout_sec=1.0):
-            self.info('Get local costmaps service not available, waiting...')
-        req = GetCostmap.Request()
-        future = self.get_costmap_local_srv.call_async(req)
-        rclpy.spin_until_future_complete(self, future)
-        return future.result().map
-
-    def lifecycleStartup(self):
+        self._waitForService(self.get_costmap_local_srv, 'Get local costmaps', timeout_sec)
+        req = self._EMPTY_GETCOSTMAP_REQ
+        response = self._callService(self.get_costmap_local_srv, req, timeout_sec)
+        if response is None:
+            self.error('Get local costmap request timed out!')
+            return None
+        return response.map
+
+    def lifecycleStartup(self, timeout_sec=None):
         """Startup nav2 lifecycle system."""
         self.info('Starting up lifecycle nodes based on lifecycle_manager.')
+        deadline = self._deadline(timeout_sec)
         for srv_name, srv_type in self.get_service_names_and_types():
             if srv_type[0] == 'nav2_msgs/srv/ManageLifecycleNodes':
                 self.info(f'Starting up {srv_name}')
-                mgr_client = self.create_client(ManageLifecycleNodes, srv_name)
-                while not mgr_client.wait_for_service(timeout_sec=1.0):
-                    self.info(f'{srv_name} service not available, waiting...')
+                mgr_client = self._getLifecycleClient(srv_name)
+                self._waitForService(mgr_client, srv_name, self._remaining(deadline))
                 req = ManageLifecycleNodes.Request()
                 req.command = ManageLifecycleNodes.Request().STARTUP
                 future = mgr_client.call_async(req)
+                done = threading.Event()
+                future.add_done_callback(lambda _: done.set())
 
                 # starting up requires a full map->odom->base_link TF tree
                 # so if we're not successful, try forwarding the initial pose
+                last_publish = None
                 while True:
-                    rclpy.spin_until_future_complete(self, future, timeout_sec=0.10)
-                    if not future:
-                        self._waitForInitialPose()
-                    else:
+                    remaining = self._remaining(deadline)
+                    if done.wait(0.10 if remaining is None else min(0.10, remaining)):
                         break
+                    if self._remaining(deadline) == 0.0:
+                        mgr_client.remove_pending_request(future)
+                        raise Nav2TimeoutError(f'{srv_name} startup request timed out')
+                    # Once a second until amcl reports a pose, as _waitForInitialPose() does
+                    now = time.monotonic()
+                    if not self.initial_pose_received and (
+                        last_publish is None or now - last_publish >= 1.0
+                    ):
+                        self._setInitialPose()
+                        last_publish = now
         self.info('Nav2 is ready for use!')
         return
 
-    def lifecycleShutdown(self):
+    def lifecycleShutdown(self, timeout_sec=None):
         """Shutdown nav2 lifecycle system."""
         self.info('Shutting down lifecycle nodes based on lifecycle_manager.')
         for srv_name, srv_type in self.get_service_names_and_types():
             if srv_type[0] == 'nav2_msgs/srv/ManageLifecycleNodes':
                 self.info(f'Shutting down {srv_name}')
-                mgr_client = self.create_client(ManageLifecycleNodes, srv_name)
-                while not mgr_client.wait_for_service(timeout_sec=1.0):
-                    self.info(f'{srv_name} service not available, waiting...')
+                mgr_client = self._getLifecycleClient(srv_name)
+                self._waitForService(mgr_client, srv_name, timeout_sec)
                 req = ManageLifecycleNodes.Request()
                 req.command = ManageLifecycleNodes.Request().SHUTDOWN
-                future = mgr_client.call_async(req)
-                rclpy.spin_until_future_complete(self, future)
-                future.result()
+                if self._callService(mgr_client, req, timeout_sec) is None:
+                    self.error(f'{srv_name} request timed out!')
+        return
+
+    def _spinExecutor(self):
+        # A failing callback must not stop the thread every wait relies on,
+        # but spins that keep failing right away are not making progress
+        quick_failures = 0
+        while True:
+            started = time.monotonic()
+            try:
+                self._executor.spin()
+            except ExternalShutdownException:
+                pass
+            except Exception as e:
+                if time.monotonic() - started < 0.1:
+                    quick_failures += 1
+                else:
+                    quick_failures = 1
+                if quick_failures >= 3:
+                    self.error(f'Navigator executor keeps failing, stopping: {e!r}')
+                    raise
+                self.error(f'Navigator callback raised: {e!r}')
+                continue
+            return
+
+    def _waitForFuture(self, future, timeout_sec=None):
+        # Returns whether the future completed within the timeout
+        if future.done():
+            return True
+        done = threading.Event()
+        future.add_done_callback(lambda _: done.set())
+        return done.wait(timeout=timeout_sec)
+
+    def _timeout(self, timeout_sec, default):
+        # Per call timeouts override the navigator wide defaults
+        return default if timeout_sec is None else timeout_sec
+
+    def _deadline(self, timeout_sec):
+        # Monotonic time a wait of timeout_sec ends at, None never ends
+        return None if timeout_sec is None else time.monotonic() + timeout_sec
+
+    def _remaining(self, deadline):
+        return None if deadline is None else max(0.0, deadline - time.monotonic())
+
+    def _callService(self, client, request, timeout_sec=None):
+        # Returns None when no response arrived within the request timeout
+        return self._callServices([(client, request)], timeout_sec)[0]
+
+    def _callServices(self, calls, timeout_sec=None):
+        # Sends every request before waiting, all share one request timeout
+        futures = [(client, client.call_async(request)) for client, request in calls]
+        deadline = self._deadline(self._timeout(timeout_sec, self.request_timeout))
+        responses = []
+        for client, future in futures:
+            if not self._waitForFuture(future, self._remaining(deadline)):
+                client.remove_pending_request(future)
+                responses.append(None)
+            else:
+                responses.append(future.result())
+        return responses
+
+    def _sendGoal(
+        self,
+        client,
+        server_name,
+        goal_msg,
+        reject_msg,
+        *reject_args,
+        timeout_sec=None,
+        feedback=True,
+    ):
+        # Common send path of every goal, task feedback lands in the task state
+        self._waitForServer(client, server_name, timeout_sec)
+        send_goal_future = client.send_goal_async(
+            goal_msg, self._feedback_cb if feedback else None
+        )
+        if not self._waitForFuture(
+            send_goal_future, self._timeout(timeout_sec, self.request_timeout)
+        ):
+            self.error(f"'{server_name}' goal request timed out!")
+            self._cancelLateGoal(send_goal_future)
+            self._state.status = GoalStatus.STATUS_UNKNOWN
+            return False
+        return self._acceptGoal(send_goal_future, reject_msg, *reject_args)
+
+    def _acceptGoal(self, send_goal_future, reject_msg, *reject_args):
+        # Tracks an answered goal, returns whether the server accepted it
+        self._state.goal_handle = send_goal_future.result()
+        if self._state.goal_handle is None or not self._state.goal_handle.accepted:
+            self.error(reject_msg.format(*reject_args))
+            return False
+        self._getResultAsync()
+        return True
+
+    def _runAction(self, client, server_name, goal_msg, reject_msg, timeout_sec=None):
+        # Sends the goal and waits for its result, None when either never came
+        if not self._sendGoal(
+            client, server_name, goal_msg, reject_msg, timeout_sec=timeout_sec, feedback=False
+        ):
+            return None
+        if not self._state.result_done.wait(self._timeout(timeout_sec, self.result_timeout)):
+            self.error(f"'{server_name}' result timed out!")
+            self._state.goal_handle.cancel_goal_async()
+            self._state.status = GoalStatus.STATUS_UNKNOWN
+            return None
+        res = self._state.result_future.result()
+        self._state.status = res.status
+        return res.result
+
+    def _chainGoal(self, client, goal_msg, reject_msg, pipeline, on_result):
+        # Sends a goal without blocking, its successful result is handed to
+        # on_result while any failure completes the pipeline with None
+        def goalResponse(send_goal_future):
+            if pipeline.cancelled():
+                # The caller gave up, do not leave a just accepted goal running
+                self._cancelLateGoal(send_goal_future)
+                return
+            if not self._acceptGoal(send_goal_future, reject_msg):
+                pipeline.set_result(None)
+                return
+            if pipeline.cancelled():
+                # Gave up while this goal was being accepted, it may have
+                # cancelled the previous goal handle instead of this one
+                self._state.goal_handle.cancel_goal_async()
+                return
+            self._state.result_future.add_done_callback(result)
+
+        def result(result_future):
+            if pipeline.cancelled():
+                return
+            rtn = result_future.result()
+            if rtn is None:
+                pipeline.set_result(None)
+                return
+            self._state.status = rtn.status
+            if rtn.status != GoalStatus.STATUS_SUCCEEDED:
+                pipeline.set_result(None)
+                return
+            on_result(rtn.result)
+
+        client.send_goal_async(goal_msg).add_done_callback(goalResponse)
+        return
+
+    def _fillPathGoal(self, goal_msg, start, goal, planner_id, use_start):
+        goal_msg.start = start
+        goal_msg.goal = goal
+        goal_msg.planner_id = planner_id
+        goal_msg.use_start = use_start
+        return goal_msg
+
+    def _fillSmoothGoal(self, goal_msg, smoother_id, max_duration, check_for_collision):
+        # The path is left to the caller, getSmoothedPath() only has it later
+        goal_msg.max_smoothing_duration = rclpyDuration(seconds=max_duration).to_msg()
+        goal_msg.smoother_id = smoother_id
+        goal_msg.check_for_collisions = check_for_collision
+        return goal_msg
+
+    def _cancelLateGoal(self, send_goal_future):
+        # Nobody tracks a goal accepted after its request timed out, stop it
+        def cancel(future):
+            goal_handle = future.result()
+            if goal_handle is not None and goal_handle.accepted:
+                goal_handle.cancel_goal_async()
+
+        send_goal_future.add_done_callback(cancel)
+        return
+
+    def _getResultAsync(self):
+        # Completion is flagged once per goal so polling adds no callbacks
+        self._state.result_future = self._state.goal_handle.get_result_async()
+        done = threading.Event()
+        self._state.result_done = done
+        self._state.result_future.add_done_callback(lambda _: done.set())
+        return
+
+    def _getLifecycleClient(self, srv_name):
+        client = self._lifecycle_clients.get(srv_name)
+        if client is None:
+            client = self.create_client(ManageLifecycleNodes, srv_name)
+            self._lifecycle_clients[srv_name] = client
+        return client
+
+    def _waitForServer(self, client, server_name, timeout_sec=None):
+        # Blocks until the action server is up, checked again on every use
+        if client.server_is_ready():
+            return
+        self.debug(f"Waiting for '{server_name}' action server")
+        self.info(f"'{server_name}' action server not available, waiting...")
+        timeout_sec = self._timeout(timeout_sec, self.server_timeout)
+        if not client.wait_for_server(timeout_sec=timeout_sec):
+            raise Nav2TimeoutError(f"'{server_name}' action server not available")
+        return
+
+    def _waitForService(self, client, service_name, timeout_sec=None):
+        if client.service_is_ready():
+            return
+        self.info(f'{service_name} service not available, waiting...')
+        timeout_sec = self._timeout(timeout_sec, self.server_timeout)
+        if not client.wait_for_service(timeout_sec=timeout_sec):
+            raise Nav2TimeoutError(f'{service_name} service not available')
         return
 
-    def _waitForNodeToActivate(self, node_name):
+    def _waitForNodeToActivate(self, node_name, timeout_sec=None):
         # Waits for the node within the tester namespace to become active
         self.debug(f'Waiting for {node_name} to become active..')
         node_service = f'{node_name}/get_state'
-        state_client = self.create_client(GetState, node_service)
-        while not state_client.wait_for_service(timeout_sec=1.0):
-            self.info(f'{node_service} service not available, waiting...')
+        state_client = self._state_clients.get(node_service)
+        if state_client is None:
+            state_client = self.create_client(GetState, node_service)
+            self._state_clients[node_service] = state_client
+        deadline = self._deadline(timeout_sec)
+        self._waitForService(state_client, node_service, self._remaining(deadline))
 
         req = GetState.Request()
         state = 'unknown'
-        while state != 'active':
+        delay = 0.05
+        while True:
             self.debug(f'Getting {node_name} state...')
-            future = state_client.call_async(req)
-            rclpy.spin_until_future_complete(self, future)
-            if future.result() is not None:
-                state = future.result().current_state.label
+            response = self._callService(state_client, req, self._remaining(deadline))
+            if response is not None:
+                state = response.current_state.label
                 self.debug(f'Result of get_state: {state}')
-            time.sleep(2)
+            if state == 'active':
+                break
+            # Back off from quick polls while the node is still coming up
+            if deadline is not None and time.monotonic() + delay > deadline:
+                raise Nav2TimeoutError(f'{node_name} did not become active')
+            time.sleep(delay)
+            delay = min(2.0, delay * 2)
         return
 
-    def _waitForInitialPose(self):
+    def _waitForInitialPose(self, timeout_sec=None):
+        deadline = self._deadline(timeout_sec)
         while not self.initial_pose_received:
+            remaining = self._remaining(deadline)
+            if remaining == 0.0:
+                raise Nav2TimeoutError('amcl_pose was not received')
             self.info('Setting initial pose')
             self._setInitialPose()
             self.info('Waiting for amcl_pose to be received')
-            rclpy.spin_once(self, timeout_sec=1.0)
+            self._initial_pose_event.wait(1.0 if remaining is None else min(1.0, remaining))
         return
 
     def _amclPoseCallback(self, msg):
         self.debug('Received amcl pose')
         self.initial_pose_received = True
+        self._initial_pose_event.set()
         return
 
     def _feedbackCallback(self, msg):
         self.debug('Received action feedback message')
-        self.feedback = msg.feedback
+        self._state.feedback = msg.feedback
         return
 
     def _setInitialPose(self):
-        msg = PoseWithCovarianceStamped()
+        # Rebinds the fields so a reassigned initial_pose or header is not missed
+        msg = self._initial_pose_msg
         msg.pose.pose = self.initial_pose.pose
         msg.header.frame_id = self.initial_pose.header.frame_id
         msg.header.stamp = self.initial_pose.header.stamp
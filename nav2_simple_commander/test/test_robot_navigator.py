@@ -0,0 +1,205 @@
+# Copyright 2021 Samsung Research America
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import time
+import unittest
+from unittest import mock
+
+from action_msgs.msg import GoalStatus
+from geometry_msgs.msg import PoseStamped
+from nav2_simple_commander.robot_navigator import _NavState, BasicNavigator, Nav2TimeoutError
+from nav_msgs.msg import Path
+from rclpy.task import Future
+
+MANAGER_SERVICE = 'lifecycle_manager_navigation/manage_nodes'
+
+
+def makeNavigator():
+    # Skips Node.__init__, the tested methods only need the pieces set here
+    nav = BasicNavigator.__new__(BasicNavigator)
+    nav.get_logger = mock.Mock
+    nav.server_timeout = None
+    nav.request_timeout = None
+    nav.result_timeout = None
+    nav._state = _NavState()
+    nav._feedback_cb = None
+    return nav
+
+
+def doneFuture(result):
+    future = Future()
+    future.set_result(result)
+    return future
+
+
+def makeActionClient(make_result):
+    # Accepts every goal and succeeds with make_result(goal_msg)
+    def sendGoal(goal_msg, feedback_callback=None):
+        goal_handle = mock.Mock(accepted=True)
+        goal_handle.get_result_async.return_value = doneFuture(
+            mock.Mock(status=GoalStatus.STATUS_SUCCEEDED, result=make_result(goal_msg))
+        )
+        return doneFuture(goal_handle)
+
+    client = mock.Mock()
+    client.server_is_ready.return_value = True
+    client.send_goal_async.side_effect = sendGoal
+    return client
+
+
+def makeLifecycleNavigator():
+    nav = makeNavigator()
+    nav.get_service_names_and_types = lambda: [
+        (MANAGER_SERVICE, ['nav2_msgs/srv/ManageLifecycleNodes'])
+    ]
+    nav.initial_pose = PoseStamped()
+    nav.initial_pose_received = False
+    nav._initial_pose_msg = mock.Mock()
+    nav.initial_pose_pub = mock.Mock()
+    nav.mgr_client = mock.Mock()
+    nav.mgr_client.service_is_ready.return_value = True
+    nav.mgr_client.call_async.return_value = Future()
+    nav._lifecycle_clients = {MANAGER_SERVICE: nav.mgr_client}
+    return nav
+
+
+class TestLifecycleStartup(unittest.TestCase):
+
+    def startAfter(self, nav, delay):
+        timer = threading.Timer(delay, nav.mgr_client.call_async.return_value.set_result, [True])
+        timer.start()
+        self.addCleanup(timer.cancel)
+
+    def test_forwards_initial_pose_once_a_second(self):
+        # Test if the initial pose is throttled while startup is pending
+        nav = makeLifecycleNavigator()
+        self.startAfter(nav, 0.35)
+        nav.lifecycleStartup(timeout_sec=5.0)
+        self.assertEqual(nav.initial_pose_pub.publish.call_count, 1)
+        nav.mgr_client.remove_pending_request.assert_not_called()
+
+    def test_no_forwarding_once_amcl_has_a_pose(self):
+        # Test if the initial pose is not forwarded after amcl reported one
+        nav = makeLifecycleNavigator()
+        nav.initial_pose_received = True
+        self.startAfter(nav, 0.35)
+        nav.lifecycleStartup(timeout_sec=5.0)
+        nav.initial_pose_pub.publish.assert_not_called()
+
+    def test_startup_timeout_without_amcl(self):
+        # Test if the deadline fires when no amcl_pose ever arrives
+        nav = makeLifecycleNavigator()
+        start = time.monotonic()
+        self.assertRaises(Nav2TimeoutError, nav.lifecycleStartup, timeout_sec=0.3)
+        self.assertLess(time.monotonic() - start, 1.0)
+        nav.mgr_client.remove_pending_request.assert_called_once()
+
+
+def makeStateNavigator(labels):
+    # Reports each label in turn from get_state
+    nav = makeNavigator()
+    state_client = mock.Mock()
+    state_client.service_is_ready.return_value = True
+    nav._state_clients = {'amcl/get_state': state_client}
+    nav._callService = mock.Mock(
+        side_effect=[mock.Mock(current_state=mock.Mock(label=label)) for label in labels]
+    )
+    return nav
+
+
+class TestSetInitialPose(unittest.TestCase):
+
+    def test_publishes_the_current_initial_pose(self):
+        # Test if a reassigned initial pose is picked up by the next publish
+        nav = makeLifecycleNavigator()
+        nav._setInitialPose()
+        nav.initial_pose = mock.Mock()
+        nav._setInitialPose()
+        msg = nav.initial_pose_pub.publish.call_args[0][0]
+        self.assertIs(msg.pose.pose, nav.initial_pose.pose)
+        self.assertIs(msg.header.frame_id, nav.initial_pose.header.frame_id)
+        self.assertIs(msg.header.stamp, nav.initial_pose.header.stamp)
+
+
+class TestWaitForNodeToActivate(unittest.TestCase):
+
+    @mock.patch('time.sleep')
+    def test_backoff_is_capped(self, sleep):
+        # Test if the poll delay doubles up to its two second cap
+        nav = makeStateNavigator(['inactive'] * 8 + ['active'])
+        nav._waitForNodeToActivate('amcl')
+        self.assertEqual(
+            [c.args[0] for c in sleep.call_args_list],
+            [0.05, 0.1, 0.2, 0.4, 0.8, 1.6, 2.0, 2.0]
+        )
+
+    @mock.patch('time.sleep')
+    def test_deadline_stops_polling(self, sleep):
+        # Test if a node that never activates raises once the next poll would be late
+        nav = makeStateNavigator(['inactive'] * 4)
+        self.assertRaises(
+            Nav2TimeoutError, nav._waitForNodeToActivate, 'amcl', timeout_sec=0.3
+        )
+        self.assertEqual([c.args[0] for c in sleep.call_args_list], [0.05, 0.1, 0.2])
+
+
+class TestGetSmoothedPath(unittest.TestCase):
+
+    def setUp(self):
+        self.planned = Path()
+        self.planned.header.frame_id = 'map'
+        self.nav = makeNavigator()
+        planner = makeActionClient(lambda goal: mock.Mock(path=self.planned))
+        self.nav.compute_path_to_pose_client = planner
+        self.nav.smoother_client = makeActionClient(lambda goal: mock.Mock(path='smoothed'))
+
+    def test_smooths_the_planned_path(self):
+        # Test if the planner result is chained into the smoother request
+        self.assertEqual(self.nav.getSmoothedPath(PoseStamped(), PoseStamped()), 'smoothed')
+        smooth_goal = self.nav.smoother_client.send_goal_async.call_args[0][0]
+        self.assertEqual(smooth_goal.path, self.planned)
+        self.assertEqual(self.nav.status, GoalStatus.STATUS_SUCCEEDED)
+
+    def test_rejected_plan_is_not_smoothed(self):
+        # Test if a rejected planner goal ends the chain without smoothing
+        self.nav.compute_path_to_pose_client.send_goal_async.side_effect = None
+        self.nav.compute_path_to_pose_client.send_goal_async.return_value = doneFuture(
+            mock.Mock(accepted=False)
+        )
+        self.assertIsNone(self.nav.getSmoothedPath(PoseStamped(), PoseStamped()))
+        self.nav.smoother_client.send_goal_async.assert_not_called()
+
+    def test_timeout_cancels_late_smoother_goal(self):
+        # Test if a smoother goal accepted after the timeout gets cancelled
+        pending = Future()
+        self.nav.smoother_client.send_goal_async.side_effect = None
+        self.nav.smoother_client.send_goal_async.return_value = pending
+        self.assertIsNone(
+            self.nav.getSmoothedPath(PoseStamped(), PoseStamped(), timeout_sec=0.1)
+        )
+        late_goal = mock.Mock(accepted=True)
+        pending.set_result(late_goal)
+        late_goal.cancel_goal_async.assert_called_once()
+
+    def test_smoother_errors_reach_the_caller(self):
+        # Test if an error raised while chaining is raised in the caller
+        self.nav.smoother_client.send_goal_async.side_effect = RuntimeError('boom')
+        self.assertRaises(
+            RuntimeError, self.nav.getSmoothedPath, PoseStamped(), PoseStamped()
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()